@@ -7,16 +7,24 @@ to the Pi's WebSocket endpoint at the video's native fps.
 Requirements:
     pip install websockets rich typer
     ffmpeg and ffprobe must be on PATH
+
+Optional:
+    pip install uvloop    # faster event loop, used automatically if present
 """
 
 import asyncio
-import json
+import collections
+import contextlib
+import fcntl
+import itertools
+import os
 import signal
-import subprocess
-import threading
+import socket
+import sys
 import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
-from queue import Empty, Queue
 
 import typer
 import websockets
@@ -25,57 +33,288 @@ from rich.live import Live
 from rich.table import Table
 from typing import Annotated
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 app = typer.Typer(help="Stream video to an LED matrix over WebSocket.")
 console = Console()
 
-# Sentinel value to signal end-of-stream from the reader thread
+# Sentinel value to signal end-of-stream from the frame reader
 _EOF = object()
 
+# Status table redraws per second, matching the Live refresh rate
+STATUS_REFRESH_HZ = 4
+
+STATE_COLORS = {
+    "Streaming": "bold green",
+    "Buffering": "bold blue",
+    "Done": "bold green",
+}
+
+# Progress bar template, sliced into filled/unfilled halves on each redraw
+PROGRESS_BAR = "━" * 30
+
+# Waits shorter than this are spun out with sleep(0) instead of a timer,
+# which can overshoot by a millisecond or more
+SPIN_THRESHOLD = 0.002
+
+# Longer waits wake this far ahead of the deadline and spin the rest
+SLEEP_MARGIN = 0.0005
+
+# Most buffers os.readv() accepts in one call (1024 on Linux)
+IOV_MAX = os.sysconf("SC_IOV_MAX")
+
+# Kernel buffer to request for an ffmpeg stdout socket pair
+SOCKET_BUFFER = 8 << 20
+
+# Kernel buffer to request for an ffmpeg stdout pipe. This is the default
+# /proc/sys/fs/pipe-max-size, so unprivileged users can always get it.
+PIPE_SIZE = 1 << 20
+
+# Pipe capacity where it can't be set or queried (macOS pipes grow to 64KB)
+FIXED_PIPE_SIZE = 64 << 10
+
+
+class ProbeError(Exception):
+    """ffprobe couldn't report a frame rate for the video."""
+
+
+async def get_video_info(video_path: str) -> tuple[float, float]:
+    """Extract video fps and duration using ffprobe.
 
-def get_video_info(video_path: str) -> tuple[float, float]:
-    """Extract video fps and duration using ffprobe."""
-    result = subprocess.run(
-        [
+    Only the two needed fields are requested, as bare CSV values: the
+    stream's frame rate on the first line, the container duration on the
+    second. Raises ProbeError if ffprobe can't run or finds no frame rate.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
             "ffprobe",
             "-v", "quiet",
-            "-print_format", "json",
-            "-show_streams",
-            "-show_format",
             "-select_streams", "v:0",
+            "-show_entries", "stream=r_frame_rate:format=duration",
+            "-of", "csv=p=0",
             video_path,
-        ],
-        capture_output=True,
-        text=True,
-    )
-    info = json.loads(result.stdout)
-    stream = info["streams"][0]
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError as e:
+        raise ProbeError(f"Could not run ffprobe: {e}") from None
+    stdout, _ = await proc.communicate()
+    lines = stdout.decode().split()
+
+    # Without a video stream only the duration line is printed
+    try:
+        num, den = lines[0].split("/")  # e.g. "30/1"
+        fps = float(num) / float(den)
+    except (IndexError, ValueError, ZeroDivisionError):
+        fps = 0.0
+    if fps <= 0:
+        raise ProbeError(f"No video stream with a frame rate in {video_path}")
+
+    # Duration is "N/A" for some streams
+    try:
+        duration = float(lines[1])
+    except (IndexError, ValueError):
+        duration = 0.0
 
-    rate_str = stream["r_frame_rate"]  # e.g. "30/1"
-    num, den = rate_str.split("/")
-    fps = float(num) / float(den)
+    return fps, duration
 
-    duration = float(info.get("format", {}).get("duration", 0))
 
-    return fps, duration
+async def unless_cancelled(aw: Awaitable, cancelled: asyncio.Event) -> None:
+    """Await `aw`, abandoning (and cancelling) it if `cancelled` is set first."""
+    task = asyncio.ensure_future(aw)
+    stop = asyncio.create_task(cancelled.wait())
+    await asyncio.wait([task, stop], return_when=asyncio.FIRST_COMPLETED)
+    stop.cancel()
+    if not task.done():
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    else:
+        task.result()
 
 
-def frame_reader(proc: subprocess.Popen, queue: Queue, frame_size: int, stop: threading.Event) -> None:
-    """Background thread: read frames from ffmpeg stdout into the queue."""
-    try:
-        while not stop.is_set():
-            data = proc.stdout.read(frame_size)
-            if len(data) < frame_size:
-                break
-            queue.put(data)
-    finally:
-        queue.put(_EOF)
+async def sleep_until(deadline: float) -> None:
+    """Sleep until a time.monotonic() deadline without oversleeping it."""
+    delay = deadline - time.monotonic()
+    if delay >= SPIN_THRESHOLD:
+        await asyncio.sleep(delay - SLEEP_MARGIN)
+    while time.monotonic() < deadline:
+        await asyncio.sleep(0)
+
+
+def request_socket_buffer(sock: socket.socket, option: int) -> int:
+    """Ask for up to SOCKET_BUFFER, halving while refused; return the size granted.
+
+    Some kernels reject oversized requests (macOS caps the total, overhead
+    included, at kern.ipc.maxsockbuf) while Linux silently clamps them, so
+    the size is always read back.
+    """
+    size = SOCKET_BUFFER
+    while size >= FIXED_PIPE_SIZE:
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, size)
+            break
+        except OSError:
+            size //= 2
+    return sock.getsockopt(socket.SOL_SOCKET, option)
+
+
+def open_socketpair() -> tuple[int, int, int]:
+    """Create a Unix socket pair as (read_fd, write_fd, buffer size)."""
+    reader, writer = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    if sys.platform == "linux":
+        # Linux charges socket pair data to the sender only
+        size = request_socket_buffer(writer, socket.SO_SNDBUF)
+    else:
+        # BSD-derived kernels such as macOS charge it to the receiver
+        size = request_socket_buffer(reader, socket.SO_RCVBUF)
+    return reader.detach(), writer.detach(), size
+
+
+def open_pipe() -> tuple[int, int, int]:
+    """Create a pipe, grown to PIPE_SIZE where possible, as (read_fd, write_fd, buffer size)."""
+    read_fd, write_fd = os.pipe()
+    if not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return read_fd, write_fd, FIXED_PIPE_SIZE
+    with contextlib.suppress(OSError):
+        fcntl.fcntl(read_fd, fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+    return read_fd, write_fd, fcntl.fcntl(read_fd, fcntl.F_GETPIPE_SZ)
+
+
+def frame_channel(use_socketpair: bool | None = None) -> tuple[int, int, bool]:
+    """Create the channel ffmpeg writes frames into as (read_fd, write_fd, use_socketpair).
+
+    A Unix socket pair is only worth using when the kernel grants it a
+    bigger buffer than a pipe gets. On stock Linux it doesn't: SO_SNDBUF is
+    clamped to twice net.core.wmem_max (about 416KB), below the 1MB
+    F_SETPIPE_SZ allows. With `use_socketpair` unset, both are built and
+    only the larger is kept; pass the returned flag back on later calls to
+    skip the comparison.
+    """
+    if use_socketpair is not None:
+        read_fd, write_fd, _ = open_socketpair() if use_socketpair else open_pipe()
+        return read_fd, write_fd, use_socketpair
+
+    sock_read, sock_write, sock_size = open_socketpair()
+    pipe_read, pipe_write, pipe_size = open_pipe()
+    use_socketpair = sock_size > pipe_size
+    for fd in (pipe_read, pipe_write) if use_socketpair else (sock_read, sock_write):
+        os.close(fd)
+    if use_socketpair:
+        return sock_read, sock_write, True
+    return pipe_read, pipe_write, False
+
+
+class FrameReader:
+    """Read ffmpeg stdout straight into a pool of preallocated frame buffers.
+
+    The fd is switched to non-blocking mode and drained by an add_reader()
+    callback with os.readv(), which scatters the data across the buffer
+    being filled and every free one behind it, so one syscall can complete
+    several frames. Filled buffers move to the `full` queue and are sent
+    without copying, then handed back to the `free` pool with `release()`.
+    Reading stops while no buffer is free.
+
+    `prefilled` is set once every buffer has been filled, or at end of
+    stream for videos shorter than the pool.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, fd: int, frame_size: int, buffer_frames: int) -> None:
+        self.loop = loop
+        self.fd = fd
+        self.frame_size = frame_size
+        self.buffer_frames = buffer_frames
+        # Views are created once with their buffers and reused for every frame
+        self.free = collections.deque(memoryview(bytearray(frame_size)) for _ in range(buffer_frames))
+        self.full: asyncio.Queue = asyncio.Queue()
+        self.prefilled = asyncio.Event()
+        self._fill = 0  # bytes already read into free[0]
+        self._reading = False
+        self._eof = False
+        os.set_blocking(fd, False)
+        self._resume()
+
+    def _resume(self) -> None:
+        if not self._reading and not self._eof:
+            self.loop.add_reader(self.fd, self._on_readable)
+            self._reading = True
+
+    def _pause(self) -> None:
+        if self._reading:
+            self.loop.remove_reader(self.fd)
+            self._reading = False
+
+    def _on_readable(self) -> None:
+        iov = list(itertools.islice(self.free, IOV_MAX))
+        if self._fill:
+            iov[0] = iov[0][self._fill:]
+        try:
+            n = os.readv(self.fd, iov)
+        except BlockingIOError:
+            return
+        except OSError:
+            # Treat a failed read like end of stream so the callback stops
+            n = 0
+        if n == 0:
+            # A trailing partial frame is dropped, same as a short read
+            self._pause()
+            self._eof = True
+            self.full.put_nowait(_EOF)
+            self.prefilled.set()
+            return
+
+        n += self._fill
+        while n >= self.frame_size:
+            self.full.put_nowait(self.free.popleft())
+            n -= self.frame_size
+        self._fill = n
+        if not self.free:
+            self._pause()
+            self.prefilled.set()
+
+    async def get_batch(self) -> list:
+        """Wait for a frame, then take every other frame already queued.
+
+        Draining without re-awaiting saves a queue wakeup per frame when
+        the reader is ahead. A batch may end with `_EOF`.
+        """
+        batch = [await self.full.get()]
+        while not self.full.empty():
+            batch.append(self.full.get_nowait())
+        return batch
+
+    @property
+    def buffered(self) -> int:
+        """Frames read but not yet released, whether queued or in a batch."""
+        return self.buffer_frames - len(self.free)
+
+    def release(self, buf: memoryview) -> None:
+        """Return a sent frame's buffer to the free pool."""
+        self.free.append(buf)
+        self._resume()
+
+    def close(self) -> None:
+        self._pause()
+        self._eof = True
+
+
+@dataclass
+class StreamStatus:
+    """Counters shared between the send loop and the status display."""
+
+    state: str
+    frame_count: int = 0
+    frames: FrameReader | None = None
 
 
 def make_status_table(
-    video_path: str,
-    ws_url: str,
+    static_rows: list[tuple[str, str]],
     fps: float,
     duration: float,
+    total_frames: int,
     state: str,
     frame_count: int,
     elapsed: float,
@@ -83,30 +322,28 @@ def make_status_table(
     buffer_fill: int,
     buffer_cap: int,
 ) -> Table:
-    """Build a Rich table showing current streaming status."""
+    """Build a Rich table showing current streaming status.
+
+    `static_rows` are the label/value pairs that don't change during a run
+    (source and target) and `total_frames` is derived from the duration and
+    fps; both are computed once by the caller.
+    """
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column(style="bold cyan", min_width=10)
     table.add_column()
 
-    state_colors = {
-        "Streaming": "bold green",
-        "Buffering": "bold blue",
-        "Done": "bold green",
-    }
-    style = state_colors.get(state, "bold yellow")
-    table.add_row("Source", video_path)
-    table.add_row("Target", ws_url)
+    style = STATE_COLORS.get(state, "bold yellow")
+    for row in static_rows:
+        table.add_row(*row)
     table.add_row("State", f"[{style}]{state}[/]")
     table.add_row("FPS", f"{actual_fps:.1f} / {fps:.1f} target")
     table.add_row("Frames", str(frame_count))
     table.add_row("Buffer", f"{buffer_fill} / {buffer_cap}")
 
     if duration > 0:
-        total_frames = int(duration * fps)
         progress = min(frame_count / total_frames, 1.0) if total_frames > 0 else 0
-        bar_width = 30
-        filled = int(bar_width * progress)
-        bar = f"[green]{'━' * filled}[/][dim]{'━' * (bar_width - filled)}[/]"
+        filled = int(len(PROGRESS_BAR) * progress)
+        bar = f"[green]{PROGRESS_BAR[:filled]}[/][dim]{PROGRESS_BAR[filled:]}[/]"
         table.add_row("Progress", f"{bar} {progress:.0%}")
 
     elapsed_str = f"{int(elapsed // 60)}:{int(elapsed % 60):02d}"
@@ -120,6 +357,17 @@ def make_status_table(
     return table
 
 
+async def ui_loop(live: Live, render: Callable[[], Table]) -> None:
+    """Redraw the status table at STATUS_REFRESH_HZ until cancelled.
+
+    Keeps Rich table construction off the send path, which only updates
+    the shared StreamStatus counters.
+    """
+    while True:
+        live.update(render())
+        await asyncio.sleep(1 / STATUS_REFRESH_HZ)
+
+
 async def stream(
     video_path: str,
     ws_url: str,
@@ -127,115 +375,163 @@ async def stream(
     fps_override: float | None,
     buffer_frames: int,
     loop: bool,
+    hwaccel: str,
+    scale_flags: str,
+    threads: int,
 ) -> None:
     frame_size = size * size * 3
-    fps, duration = get_video_info(video_path)
-    if fps_override is not None:
-        fps = fps_override
-    frame_interval = 1.0 / fps
+    # Probe the video while the WebSocket handshake is in flight; the
+    # status table shows zeros for fps and duration until it returns
+    probe = asyncio.create_task(get_video_info(video_path))
+    fps, duration, total_frames = 0.0, 0.0, 0
 
+    status = StreamStatus(state="Connecting...")
     cancelled = asyncio.Event()
-    loop_ref = asyncio.get_event_loop()
-    loop_ref.add_signal_handler(signal.SIGINT, cancelled.set)
 
-    frame_count = 0
+    def on_signal() -> None:
+        cancelled.set()
+        # Wake a send loop waiting on ffmpeg, which may be stalled
+        if status.frames is not None:
+            status.frames.full.put_nowait(_EOF)
+
+    loop_ref = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop_ref.add_signal_handler(sig, on_signal)
+
     start_time = time.monotonic()
-    actual_fps = 0.0
+    static_rows = [("Source", video_path), ("Target", ws_url)]
+
+    async def apply_probe(timeout: float | None = None) -> None:
+        """Fill in fps, duration and total_frames from the probe task."""
+        nonlocal fps, duration, total_frames
+        fps, duration = await asyncio.wait_for(probe, timeout)
+        if fps_override is not None:
+            fps = fps_override
+        total_frames = int(duration * fps)
 
-    with Live(
-        make_status_table(video_path, ws_url, fps, duration, "Connecting...", 0, 0, 0, 0, buffer_frames),
-        console=console,
-        refresh_per_second=4,
-    ) as live:
+    def status_table() -> Table:
+        # Timing is sampled here, at redraw rate, rather than per frame
+        elapsed = time.monotonic() - start_time
+        actual_fps = status.frame_count / elapsed if elapsed > 0 else 0.0
+        buffer_fill = status.frames.buffered if status.frames is not None else 0
+        return make_status_table(
+            static_rows, fps, duration, total_frames,
+            status.state, status.frame_count, elapsed, actual_fps,
+            buffer_fill, buffer_frames,
+        )
+
+    with Live(status_table(), console=console, refresh_per_second=STATUS_REFRESH_HZ) as live:
+        ui = asyncio.create_task(ui_loop(live, status_table))
         try:
-            async with websockets.connect(ws_url, max_size=frame_size + 1024) as ws:
+            # Raw RGB doesn't benefit from permessage-deflate, and a 1MB write
+            # buffer lets several frames go out without waiting on drain()
+            async with websockets.connect(
+                ws_url,
+                max_size=frame_size + 1024,
+                compression=None,
+                write_limit=2**20,
+            ) as ws:
+                await unless_cancelled(apply_probe(), cancelled)
+
+                use_socketpair = None  # decided by the first frame_channel() call
                 while not cancelled.is_set():
-                    # Start ffmpeg and reader thread for this pass
-                    ffmpeg = subprocess.Popen(
-                        [
+                    # Start ffmpeg writing into a channel we read on the event loop.
+                    # It is ours rather than stdout=PIPE so FrameReader can
+                    # drain the raw fd instead of going through a StreamReader.
+                    read_fd, write_fd, use_socketpair = frame_channel(use_socketpair)
+                    try:
+                        ffmpeg = await asyncio.create_subprocess_exec(
                             "ffmpeg",
+                            "-hwaccel", hwaccel,
+                            "-threads", str(threads),
                             "-i", video_path,
-                            "-vf", f"scale={size}:{size}",
+                            "-vf", f"scale={size}:{size}:flags={scale_flags}",
                             "-pix_fmt", "rgb24",
                             "-f", "rawvideo",
                             "-v", "quiet",
                             "-",
-                        ],
-                        stdout=subprocess.PIPE,
-                    )
-
-                    queue: Queue = Queue(maxsize=buffer_frames)
-                    stop_reader = threading.Event()
-                    reader = threading.Thread(
-                        target=frame_reader,
-                        args=(ffmpeg, queue, frame_size, stop_reader),
-                        daemon=True,
-                    )
-                    reader.start()
+                            stdout=write_fd,
+                        )
+                    finally:
+                        os.close(write_fd)
+
+                    frames = FrameReader(loop_ref, read_fd, frame_size, buffer_frames)
+                    status.frames = frames
 
                     # Wait for buffer to fill before starting playback
-                    while queue.qsize() < min(buffer_frames, buffer_frames) and not cancelled.is_set():
-                        live.update(make_status_table(
-                            video_path, ws_url, fps, duration,
-                            "Buffering", frame_count, time.monotonic() - start_time, actual_fps,
-                            queue.qsize(), buffer_frames,
-                        ))
-                        await asyncio.sleep(0.05)
-
-                    # Send loop
+                    status.state = "Buffering"
+                    await unless_cancelled(frames.prefilled.wait(), cancelled)
+
+                    # Send loop, paced against absolute deadlines so that a
+                    # late frame is made up on the next one instead of drifting
+                    status.state = "Streaming"
+                    frame_interval = 1.0 / fps
                     eof = False
+                    next_deadline = time.monotonic()
                     while not cancelled.is_set() and not eof:
-                        try:
-                            data = queue.get_nowait()
-                        except Empty:
-                            await asyncio.sleep(0.001)
-                            continue
-
-                        if data is _EOF:
-                            eof = True
-                            break
-
-                        send_time = time.monotonic()
-                        await ws.send(data)
-                        frame_count += 1
-
-                        elapsed = send_time - start_time
-                        if elapsed > 0:
-                            actual_fps = frame_count / elapsed
-
-                        live.update(make_status_table(
-                            video_path, ws_url, fps, duration,
-                            "Streaming", frame_count, elapsed, actual_fps,
-                            queue.qsize(), buffer_frames,
-                        ))
-
-                        # Pace to target fps
-                        elapsed_frame = time.monotonic() - send_time
-                        sleep_time = frame_interval - elapsed_frame
-                        if sleep_time > 0:
-                            await asyncio.sleep(sleep_time)
-
-                    # Clean up this pass
-                    stop_reader.set()
-                    ffmpeg.terminate()
-                    ffmpeg.wait()
-                    reader.join(timeout=2)
+                        for data in await frames.get_batch():
+                            if data is _EOF:
+                                eof = True
+                                break
+
+                            # One frame per message: the Pi renders each binary
+                            # message as it arrives, so packing several frames
+                            # into one send would show them as a burst.
+                            await ws.send(data)
+                            frames.release(data)
+                            status.frame_count += 1
+
+                            # Pace to target fps, resyncing after a long stall
+                            next_deadline += frame_interval
+                            delay = next_deadline - time.monotonic()
+                            if delay > 0:
+                                await sleep_until(next_deadline)
+                            elif delay < -frame_interval:
+                                next_deadline = time.monotonic()
+
+                            if cancelled.is_set():
+                                break
+
+                    # Clean up this pass without blocking the event loop
+                    frames.close()
+                    os.close(read_fd)
+                    with contextlib.suppress(ProcessLookupError):
+                        ffmpeg.terminate()
+                    try:
+                        await asyncio.wait_for(ffmpeg.wait(), timeout=2)
+                    except asyncio.TimeoutError:
+                        ffmpeg.kill()
+                        await ffmpeg.wait()
 
                     if not loop or cancelled.is_set():
                         break
 
         except ConnectionRefusedError:
-            live.update(make_status_table(
-                video_path, ws_url, fps, duration,
-                "Connection refused", frame_count, time.monotonic() - start_time, actual_fps,
-                0, buffer_frames,
-            ))
+            status.state = "Connection refused"
+            # Still show the video's fps and duration if ffprobe finishes soon
+            with contextlib.suppress(asyncio.TimeoutError, ProbeError):
+                await apply_probe(timeout=1.0)
             console.print(f"\n[bold red]Could not connect to {ws_url}[/]")
             return
+        except ProbeError as e:
+            status.state = "Probe failed"
+            console.print(f"\n[bold red]{e}[/]")
+            return
         except websockets.ConnectionClosed as e:
             console.print(f"\n[bold red]Connection closed: {e}[/]")
             return
-
+        finally:
+            # Retrieve a probe failure no other path awaited, so asyncio
+            # doesn't log it as never retrieved
+            if probe.done() and not probe.cancelled():
+                probe.exception()
+            probe.cancel()
+            ui.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await ui
+            live.update(status_table())
+
+    frame_count = status.frame_count
     elapsed = time.monotonic() - start_time
     if elapsed > 0:
         console.print(f"\n[bold]Done[/] — {frame_count} frames in {elapsed:.1f}s ({frame_count / elapsed:.1f} fps)")
@@ -249,15 +545,22 @@ def main(
     url: Annotated[str, typer.Argument(help="WebSocket URL, e.g. ws://pi:8080/api/v1/display/stream")],
     size: Annotated[int, typer.Option(help="Panel dimension (pixels per side)")] = 64,
     fps: Annotated[float | None, typer.Option(help="Override video fps")] = None,
-    buffer: Annotated[int, typer.Option(help="Number of frames to buffer ahead")] = 30,
+    buffer: Annotated[int, typer.Option(min=1, help="Number of frames to buffer ahead")] = 30,
     loop: Annotated[bool, typer.Option("--loop", help="Loop video playback")] = False,
+    hwaccel: Annotated[str, typer.Option(help="ffmpeg hardware decode method, or 'none' for software")] = "auto",
+    scale_flags: Annotated[str, typer.Option(help="ffmpeg scaler algorithm, e.g. bicubic or lanczos")] = "fast_bilinear",
+    threads: Annotated[int, typer.Option(help="ffmpeg decode threads (0 = auto)")] = 0,
 ) -> None:
     """Stream video to an LED matrix over WebSocket."""
     if not video.exists():
         console.print(f"[bold red]File not found: {video}[/]")
         raise typer.Exit(1)
 
-    asyncio.run(stream(str(video), url, size, fps, buffer, loop))
+    coro = stream(str(video), url, size, fps, buffer, loop, hwaccel, scale_flags, threads)
+    if uvloop is not None:
+        uvloop.run(coro)
+    else:
+        asyncio.run(coro)
 
 
 if __name__ == "__main__":